@@ -577,22 +577,34 @@ class RasterExportApp(ctk.CTk):
                     if gdf.crs != src.crs:
                         gdf = gdf.to_crs(src.crs)
                     
-                    out_img, _ = mask(src, gdf.geometry, crop=True)
-                    arr = out_img[0].astype(float)
+                    # Only band 1 is displayed, so don't materialise the others
+                    arr, _ = mask(src, gdf.geometry, crop=True, indexes=1)
+                    arr = arr.astype(float)
                     nodata = src.nodata
                 
                 if nodata is not None:
                     arr[arr == nodata] = np.nan
             else:
                 with rasterio.open(self.tif_path) as src:
-                    arr = src.read(1).astype(float)
+                    raw = src.read(1)
                     nodata = src.nodata
                 
+                # Create mask of valid data on the native dtype, before any float copy
+                valid_mask = np.ones(raw.shape, dtype=bool)
                 if nodata is not None:
-                    arr[arr == nodata] = np.nan
+                    valid_mask &= raw != nodata
+                if np.issubdtype(raw.dtype, np.floating):
+                    valid_mask &= ~np.isnan(raw)
                 
-                # Create mask of valid (non-NaN) data
-                valid_mask = ~np.isnan(arr)
+                # Crop to the valid-data bounding box first; everything outside it
+                # is invalid, so the ROI steps below give the same result on the crop
+                rows = np.flatnonzero(valid_mask.any(axis=1))
+                cols = np.flatnonzero(valid_mask.any(axis=0))
+                if rows.size == 0:
+                    raise ValueError("Unable to detect ROI")
+                crop = (slice(rows[0], rows[-1] + 1), slice(cols[0], cols[-1] + 1))
+                raw = raw[crop]
+                valid_mask = valid_mask[crop]
                 
                 # Apply morphological operations to clean up the mask
                 from scipy.ndimage import binary_erosion, binary_dilation
@@ -601,29 +613,28 @@ class RasterExportApp(ctk.CTk):
                 
                 # Find connected components
                 labels, num = ndimage.label(valid_mask)
+                del valid_mask
                 if num == 0:
                     raise ValueError("Unable to detect ROI")
                 
-                # Get the largest component
-                sizes = ndimage.sum(valid_mask, labels, range(1, num + 1))
-                roi_label = sizes.argmax() + 1
-                roi = labels == roi_label
+                # Get the largest component and its bounding box
+                sizes = np.bincount(labels.ravel())
+                sizes[0] = 0
+                roi_label = sizes.argmax()
+                bbox = ndimage.find_objects(labels, max_label=roi_label)[roi_label - 1]
+                roi = labels[bbox] == roi_label
+                del labels
                 
-                # Fill holes in the ROI
+                # Fill holes in the ROI (equivalent on the bounding box, since
+                # background outside it always reaches the image border)
                 roi = ndimage.binary_fill_holes(roi)
                 
-                # Find bounding box of ROI
-                rows = np.any(roi, axis=1)
-                cols = np.any(roi, axis=0)
-                rmin, rmax = np.where(rows)[0][[0, -1]]
-                cmin, cmax = np.where(cols)[0][[0, -1]]
-                
-                # Crop array to bounding box
-                arr = arr[rmin:rmax+1, cmin:cmax+1]
-                roi = roi[rmin:rmax+1, cmin:cmax+1]
-                
-                # Apply ROI mask
-                arr = np.where(roi, arr, np.nan)
+                # Crop array to bounding box and apply ROI mask
+                arr = raw[bbox].astype(float)
+                del raw
+                if nodata is not None:
+                    arr[arr == nodata] = np.nan
+                arr[~roi] = np.nan
             
             data_stats = {
                 'min': np.nanmin(arr),